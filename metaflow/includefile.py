@@ -3,6 +3,7 @@ import gzip
 import io
 import json
 import os
+import shutil
 
 from hashlib import sha1
 
@@ -158,7 +159,10 @@ class Local(object):
         if overwrite or (not os.path.exists(p)):
             Local._makedirs(os.path.dirname(p))
             with open(p, "wb") as f:
-                f.write(obj)
+                if hasattr(obj, "read"):
+                    shutil.copyfileobj(obj, f)
+                else:
+                    f.write(obj)
         return u"local://%s" % p
 
 
@@ -378,7 +382,9 @@ class Uploader:
             f.write(input_file)
         buf.seek(0)
         with self._client_class() as client:
-            url = client.put(path, buf.getvalue(), overwrite=False)
+            # Pass the buffer itself so the client can stream the upload
+            # instead of copying the whole payload into a new bytes object
+            url = client.put(path, buf, overwrite=False)
             echo("File persisted at %s" % url)
             return Uploader.encode_url(
                 Uploader.file_type, url, is_text=is_text, encoding=encoding
@@ -6,11 +6,9 @@ import sys
 from distutils.version import LooseVersion
 from hashlib import sha1
 
-from metaflow import JSONType, current, decorators, parameters
+from metaflow import JSONType, current, parameters
 from metaflow._vendor import click
 from metaflow.exception import MetaflowException, MetaflowInternalError
-from metaflow.package import MetaflowPackage
-from metaflow.plugins import EnvironmentDecorator, KubernetesDecorator
 
 # TODO: Move production_token to utils
 from metaflow.plugins.aws.step_functions.production_token import (
@@ -21,8 +19,6 @@ from metaflow.plugins.aws.step_functions.production_token import (
 from metaflow.util import get_username, to_bytes, to_unicode
 from metaflow.tagging_util import validate_tags
 
-from .argo_workflows import ArgoWorkflows
-
 VALID_NAME = re.compile("^[a-z0-9]([a-z0-9\.\-]*[a-z0-9])?$")
 
 
@@ -324,6 +320,14 @@ def resolve_workflow_name(obj, name):
 def make_flow(
     obj, token, name, tags, namespace, max_workers, workflow_timeout, workflow_priority
 ):
+    # Import these modules only when deploying a workflow so that other
+    # subcommands don't pay the import cost on start-up.
+    from metaflow import decorators
+    from metaflow.package import MetaflowPackage
+    from metaflow.plugins import EnvironmentDecorator, KubernetesDecorator
+
+    from .argo_workflows import ArgoWorkflows
+
     # TODO: Make this check less specific to Amazon S3 as we introduce
     #       support for more cloud object stores.
     if obj.flow_datastore.TYPE != "s3":
@@ -373,6 +377,8 @@ def make_flow(
 def resolve_token(
     name, token_prefix, obj, authorize, given_token, generate_new_token, is_project
 ):
+    from .argo_workflows import ArgoWorkflows
+
     # 1) retrieve the previous deployment, if one exists
     workflow = ArgoWorkflows.get_existing_deployment(name)
     if workflow is None:
@@ -479,6 +485,8 @@ def resolve_token(
 )
 @click.pass_obj
 def trigger(obj, run_id_file=None, **kwargs):
+    from .argo_workflows import ArgoWorkflows
+
     def _convert_value(param):
         # Swap `-` with `_` in parameter name to match click's behavior
         val = kwargs.get(param.name.replace("-", "_").lower())
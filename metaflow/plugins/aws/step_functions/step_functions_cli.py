@@ -2,7 +2,7 @@ import base64
 from metaflow._vendor import click
 from hashlib import sha1
 import json
-import re
+import string
 from distutils.version import LooseVersion
 
 from metaflow import current, decorators, parameters, JSONType
@@ -16,7 +16,7 @@ from metaflow.util import get_username, to_bytes, to_unicode
 from .step_functions import StepFunctions
 from .production_token import load_token, store_token, new_token
 
-VALID_NAME = re.compile("[^a-zA-Z0-9_\-\.]")
+_ALLOWED_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-.")
 
 
 class IncorrectProductionToken(MetaflowException):
@@ -244,7 +244,7 @@ def resolve_state_machine_name(obj, name):
             state_machine_name = "%s-%s" % (state_machine_name[:60], name_hash)
             obj._is_state_machine_name_hashed = True
     else:
-        if name and VALID_NAME.search(name):
+        if name and not _ALLOWED_NAME_CHARS.issuperset(name):
             raise MetaflowException("Name '%s' contains invalid characters." % name)
 
         state_machine_name = attach_prefix(name if name else current.flow_name)
@@ -1,5 +1,3 @@
-import sys
-
 from itertools import chain
 
 from metaflow import namespace
@@ -50,15 +48,10 @@ def _print_tags_for_group(
 ):
     if not obj.is_quiet:
         # Pretty printing computations
-        max_length = max([len(t) for t in all_tags] if all_tags else [0])
-
         all_tags = sorted(all_tags)
-        if sys.version_info[0] < 3:
-            all_tags = [
-                t if t in system_tags else "*%s*" % t.encode("utf-8") for t in all_tags
-            ]
-        else:
-            all_tags = [t if t in system_tags else "*%s*" % t for t in all_tags]
+        max_length = max((len(t) for t in all_tags), default=0)
+
+        all_tags = [t if t in system_tags else f"*{t}*" for t in all_tags]
 
         num_tags = len(all_tags)
 
@@ -80,16 +73,17 @@ def _print_tags_for_group(
 
         lines = []
         if not skip_per_group_header:
-            lines.append("For run %s" % group)
+            lines.append(f"For run {group}")
         for i in range(words_per_column):
             line_values = [
                 all_tags[i + j * words_per_column] for j in range(column_count)
             ]
-            length_values = [
-                max_length + 2 if l[0] == "*" else max_length for l in line_values
-            ]
-            formatter = "    ".join(["{:<%d}" % l for l in length_values])
-            lines.append(formatter.format(*line_values))
+            lines.append(
+                "    ".join(
+                    v.ljust(max_length + 2 if v[0] == "*" else max_length)
+                    for v in line_values
+                )
+            )
         lines.append("")
         obj.echo("\n".join(lines), err=False)
     else:
@@ -114,7 +108,7 @@ def _print_tags_for_group(
 def _print_tags_for_group_by_tag(obj, group, runs, is_system):
     if not obj.is_quiet:
         # Pretty printing computations
-        max_length = max([len(t) for t in runs] if runs else [0])
+        max_length = max((len(t) for t in runs), default=0)
 
         all_runs = sorted(runs)
 
@@ -136,14 +130,12 @@ def _print_tags_for_group_by_tag(obj, group, runs, is_system):
             all_runs.extend([" " for _ in range(addl_runs)])
 
         lines = []
-        lines.append("For tag %s" % (group if is_system else "*%s*" % group))
+        lines.append("For tag %s" % (group if is_system else f"*{group}*"))
         for i in range(words_per_column):
             line_values = [
                 all_runs[i + j * words_per_column] for j in range(column_count)
             ]
-            length_values = [max_length for l in line_values]
-            formatter = "    ".join(["{:<%d}" % l for l in length_values])
-            lines.append(formatter.format(*line_values))
+            lines.append("    ".join(v.ljust(max_length) for v in line_values))
         lines.append("")
         obj.echo("\n".join(lines), err=False)
     else:
@@ -156,7 +148,7 @@ def _print_tags_for_group_by_tag(obj, group, runs, is_system):
         obj.echo_always(
             " ; ".join(
                 [
-                    "system:%s" % group if is_system else "user:%s" % group,
+                    f"system:{group}" if is_system else f"user:{group}",
                     ",".join(runs),
                 ]
             )
@@ -164,61 +156,67 @@ def _print_tags_for_group_by_tag(obj, group, runs, is_system):
 
 
 def _print_tags_for_one_run(obj, run):
-    system_tags = {run.pathspec: run.system_tags}
-    all_tags = {run.pathspec: run.tags}
+    pathspec = run.pathspec
+    system_tags = {pathspec: run.system_tags}
+    all_tags = {pathspec: run.tags}
     return _print_tags_for_runs_by_groups(obj, system_tags, all_tags, by_tag=False)
 
 
-def _get_client_run_obj(obj, run_id, user_namespace):
-    flow_name = obj.flow.name
-
+def _raise_flow_not_found(flow_name, user_namespace):
     # handle error messaging for two cases
     # 1. our user tries to tag a new flow before it is run
     # 2. our user makes a typo in --namespace
     try:
-        namespace(user_namespace)
         Flow(pathspec=flow_name)
     except MetaflowNotFound:
         raise CommandException(
-            "No run found for *%s*. Please run the flow before tagging." % flow_name
+            f"No run found for *{flow_name}*. Please run the flow before tagging."
         )
-
     except MetaflowNamespaceMismatch:
         raise CommandException(
-            "No run found for *%s* in namespace *%s*. You can switch the namespace using --namespace"
-            % (flow_name, user_namespace)
+            f"No run found for *{flow_name}* in namespace *{user_namespace}*. "
+            "You can switch the namespace using --namespace"
         )
 
+
+def _get_client_run_obj(obj, run_id, user_namespace):
+    flow_name = obj.flow.name
+    namespace(user_namespace)
+
     # throw an error with message to include latest run-id when run_id is None
     if run_id is None:
-        latest_run_id = Flow(pathspec=flow_name).latest_run.id
+        try:
+            latest_run_id = Flow(pathspec=flow_name).latest_run.id
+        except (MetaflowNotFound, MetaflowNamespaceMismatch):
+            _raise_flow_not_found(flow_name, user_namespace)
+            raise
         msg = (
             "Please specify a run-id using --run-id.\n"
-            "*%s*'s latest run in namespace *%s* has id *%s*."
-            % (flow_name, user_namespace, latest_run_id)
+            f"*{flow_name}*'s latest run in namespace *{user_namespace}* "
+            f"has id *{latest_run_id}*."
         )
         raise CommandException(msg)
     run_id_parts = run_id.split("/")
     if len(run_id_parts) == 1:
-        path_spec = "%s/%s" % (flow_name, run_id)
+        path_spec = f"{flow_name}/{run_id}"
     else:
-        raise CommandException("Run-id *%s* is not a valid run-id" % run_id)
+        raise CommandException(f"Run-id *{run_id}* is not a valid run-id")
 
     # handle error messaging for three cases
-    # 1. our user makes a typo in --run-id
-    # 2. our user's --run-id does not exist in the default/specified namespace
+    # 1. our user tries to tag a new flow before it is run
+    # 2. our user makes a typo in --run-id
+    # 3. our user's --run-id does not exist in the default/specified namespace
     try:
-        namespace(user_namespace)
         run = Run(pathspec=path_spec)
     except MetaflowNotFound:
-        raise CommandException(
-            "No run *%s* found for flow *%s*" % (path_spec, flow_name)
-        )
+        # we only probe the flow on this error path so that the common case
+        # costs a single metadata round trip
+        _raise_flow_not_found(flow_name, user_namespace)
+        raise CommandException(f"No run *{path_spec}* found for flow *{flow_name}*")
     except MetaflowNamespaceMismatch:
-        msg = "Run *%s* for flow *%s* does not belong to namespace *%s*\n" % (
-            path_spec,
-            flow_name,
-            user_namespace,
+        msg = (
+            f"Run *{path_spec}* for flow *{flow_name}* does not belong to "
+            f"namespace *{user_namespace}*\n"
         )
         raise CommandException(msg)
     return run
@@ -226,8 +224,7 @@ def _get_client_run_obj(obj, run_id, user_namespace):
 
 def _set_current(obj):
     current._set_env(
-        metadata_str="%s@%s"
-        % (obj.metadata.__class__.TYPE, obj.metadata.__class__.INFO)
+        metadata_str=f"{obj.metadata.__class__.TYPE}@{obj.metadata.__class__.INFO}"
     )
 
 
@@ -461,30 +458,36 @@ def tag_list(
 
     system_tags_by_some_grouping = dict()
     all_tags_by_some_grouping = dict()
+    if not group_by_run and not group_by_tag:
+        # We aggregate into a single pair of sets; creating them upfront keeps
+        # the per-run path free of transient set allocations
+        system_tags_by_some_grouping["_"] = set()
+        all_tags_by_some_grouping["_"] = set()
 
     def _populate_tag_groups_from_run(_run):
+        # Bind the tag sets and pathspec once; each is a property access on
+        # the client object otherwise repeated in every branch below
+        run_system_tags = _run.system_tags
+        run_all_tags = _run.tags
+        run_pathspec = _run.pathspec
         if group_by_run:
             if hide_system_tags:
-                all_tags_by_some_grouping[_run.pathspec] = _run.tags - _run.system_tags
+                all_tags_by_some_grouping[run_pathspec] = run_all_tags - run_system_tags
             else:
-                system_tags_by_some_grouping[_run.pathspec] = _run.system_tags
-                all_tags_by_some_grouping[_run.pathspec] = _run.tags
+                system_tags_by_some_grouping[run_pathspec] = run_system_tags
+                all_tags_by_some_grouping[run_pathspec] = run_all_tags
         elif group_by_tag:
-            for t in _run.tags - _run.system_tags:
-                all_tags_by_some_grouping.setdefault(t, []).append(_run.pathspec)
+            for t in run_all_tags - run_system_tags:
+                all_tags_by_some_grouping.setdefault(t, []).append(run_pathspec)
             if not hide_system_tags:
-                for t in _run.system_tags:
-                    system_tags_by_some_grouping.setdefault(t, []).append(_run.pathspec)
+                for t in run_system_tags:
+                    system_tags_by_some_grouping.setdefault(t, []).append(run_pathspec)
         else:
             if hide_system_tags:
-                all_tags_by_some_grouping.setdefault("_", set()).update(
-                    _run.tags.difference(_run.system_tags)
-                )
+                all_tags_by_some_grouping["_"] |= run_all_tags - run_system_tags
             else:
-                system_tags_by_some_grouping.setdefault("_", set()).update(
-                    _run.system_tags
-                )
-                all_tags_by_some_grouping.setdefault("_", set()).update(_run.tags)
+                system_tags_by_some_grouping["_"] |= run_system_tags
+                all_tags_by_some_grouping["_"] |= run_all_tags
 
     pathspecs = []
     if list_all or my_runs: